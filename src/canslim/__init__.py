@@ -3,11 +3,19 @@ from .earnings_analyzer import EarningsAnalyzer
 from .newness_analyzer import NewnessAnalyzer
 from .supply_analyzer import SupplyAnalyzer
 from .leadership_analyzer import LeadershipAnalyzer
+from .file_cache import TickerFileCache
+from .price_cache import PriceCache
+from .financial_cache import FinancialCache
+from .dart_refresh import DartRefreshPlanner
 
 __all__ = [
     'DataManager',
     'EarningsAnalyzer',
     'NewnessAnalyzer',
     'SupplyAnalyzer',
-    'LeadershipAnalyzer'
+    'LeadershipAnalyzer',
+    'TickerFileCache',
+    'PriceCache',
+    'FinancialCache',
+    'DartRefreshPlanner'
 ]
\ No newline at end of file
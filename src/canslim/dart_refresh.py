@@ -0,0 +1,171 @@
+import json
+import re
+import threading
+import requests
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from utils import setup_logger, rate_limited
+
+logger = setup_logger('dart_refresh')
+
+DART_LIST_URL = 'https://opendart.fss.or.kr/api/list.json'
+
+# DART dates (bgn_de/end_de, rcept_dt) are Korean dates; KST has no DST
+KST = timezone(timedelta(hours=9))
+
+# Periodic reports that carry new financial statements
+PERIODIC_REPORT_PATTERN = re.compile(r'사업보고서|반기보고서|분기보고서')
+
+class DartRefreshPlanner:
+    """
+    Decides which companies need fresh DART financial statements.
+
+    Instead of asking DART about every ticker, the planner pulls DART's list of
+    new periodic disclosures (pblntf_ty=A) once per run and queues a refresh
+    only for universe companies that filed something since the last check.
+    Pending refreshes persist until the ticker has actually been refetched.
+    """
+
+    # DART's disclosure search is limited to a 3-month window without corp_code
+    MAX_LOOKBACK_DAYS = 89
+
+    def __init__(self, api_key, state_file='data/dart_cache/refresh_state.json'):
+        self.api_key = api_key
+        self.state_file = Path(state_file)
+        self.state = self._load_state()
+        self.lock = threading.Lock()
+
+    def _load_state(self):
+        if not self.state_file.exists():
+            return {'last_checked': None, 'pending': {}}
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"DART refresh state unreadable, starting fresh: {e}")
+            return {'last_checked': None, 'pending': {}}
+
+    def _save_state(self):
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.state_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        tmp_file.replace(self.state_file)
+
+    @rate_limited(calls_per_second=1)
+    def _fetch_list_page(self, start_date, end_date, page_no):
+        """Fetch one page of periodic disclosures filed between two dates."""
+        response = requests.get(DART_LIST_URL, params={
+            'crtfc_key': self.api_key,
+            'bgn_de': start_date,
+            'end_de': end_date,
+            'pblntf_ty': 'A',
+            'page_no': page_no,
+            'page_count': 100
+        }, timeout=30)
+        response.raise_for_status()
+        return response.json()
+
+    def fetch_disclosures(self, start_date, end_date):
+        """
+        Fetch all periodic disclosures filed between two dates (YYYYMMDD).
+
+        Returns: list of disclosure dicts (corp_code, stock_code, report_nm, rcept_no, ...)
+        """
+        disclosures = []
+        page_no = 1
+        while True:
+            data = self._fetch_list_page(start_date, end_date, page_no)
+            status = data.get('status')
+            if status == '013':  # No disclosures in range
+                break
+            if status != '000':
+                raise RuntimeError(f"DART list API error {status}: {data.get('message')}")
+
+            disclosures.extend(data.get('list', []))
+            if page_no >= int(data.get('total_page', 1)):
+                break
+            page_no += 1
+        return disclosures
+
+    def plan(self, universe):
+        """
+        Queue refreshes for universe companies that filed periodic reports since the last check.
+
+        The search window starts on the day of the last check (not the day
+        after), so reports filed later that same day are still picked up.
+        Filings already refreshed are skipped by their rcept_no.
+
+        Args:
+            universe: list of tickers being screened
+
+        Returns: set of tickers queued for a financial statement refresh
+        """
+        today = datetime.now(KST).replace(tzinfo=None)
+        today_str = today.strftime('%Y%m%d')
+        last_checked = self.state.get('last_checked')
+
+        if last_checked:
+            start = datetime.strptime(last_checked, '%Y%m%d')
+            start = max(start, today - timedelta(days=self.MAX_LOOKBACK_DAYS))
+        else:
+            # First run: tickers without cached financials are fetched anyway
+            start = today
+
+        try:
+            disclosures = self.fetch_disclosures(start.strftime('%Y%m%d'), today_str)
+        except Exception as e:
+            # Keep last_checked so the next run catches up on the missed window
+            logger.warning(f"Could not fetch DART disclosure list, using cached financials: {e}")
+            return self.pending()
+
+        universe_set = set(universe)
+        new_filings = 0
+        with self.lock:
+            refreshed = self.state.setdefault('refreshed', {})
+            for disclosure in disclosures:
+                ticker = disclosure.get('stock_code', '').strip()
+                rcept_no = disclosure.get('rcept_no', '')
+                if ticker not in universe_set:
+                    continue
+                if not PERIODIC_REPORT_PATTERN.search(disclosure.get('report_nm', '')):
+                    continue
+                # rcept_no starts with the filing date, so string order is filing order
+                if rcept_no <= refreshed.get(ticker, '') or rcept_no <= (self.state['pending'].get(ticker) or ''):
+                    continue
+                self.state['pending'][ticker] = rcept_no
+                new_filings += 1
+            self.state['last_checked'] = today_str
+            self._save_state()
+
+        logger.info(f"DART disclosure list: {len(disclosures)} periodic filings, "
+                    f"{new_filings} new from universe companies")
+
+        pending = self.pending()
+        logger.info(f"{len(pending)} companies queued for financial statement refresh")
+        return pending
+
+    def pending(self):
+        """Return tickers with a queued refresh."""
+        with self.lock:
+            return set(self.state['pending'])
+
+    def needs_refresh(self, ticker):
+        """Check if a ticker has filed since its financial statements were cached."""
+        with self.lock:
+            return ticker in self.state['pending']
+
+    def mark_refreshed(self, ticker):
+        """Clear a ticker's queued refresh after its statements were refetched."""
+        with self.lock:
+            rcept_no = self.state['pending'].pop(ticker, None)
+            if rcept_no is not None:
+                self.state.setdefault('refreshed', {})[ticker] = rcept_no
+                self._save_state()
+
+    def forget(self, ticker):
+        """Drop all refresh state for a ticker (e.g. after it left the universe)."""
+        with self.lock:
+            self.state['pending'].pop(ticker, None)
+            self.state.setdefault('refreshed', {}).pop(ticker, None)
+            self._save_state()
@@ -1,4 +1,5 @@
 import os
+import threading
 import pandas as pd
 from pykrx import stock
 from datetime import datetime, timedelta
@@ -8,7 +9,10 @@ from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from utils import setup_logger, rate_limited
+from utils import setup_logger, rate_limited, StoreStats
+from .price_cache import PriceCache
+from .financial_cache import FinancialCache
+from .dart_refresh import DartRefreshPlanner
 
 logger = setup_logger('data_manager')
 
@@ -25,7 +29,13 @@ class DataManager:
             logger.warning("DART API key not found. Financial data will be unavailable.")
         
         self.today = datetime.now().strftime('%Y%m%d')
+        self._fundamentals = None
+        self._fundamentals_lock = threading.Lock()
         self.start_date = (datetime.now() - timedelta(days=730)).strftime('%Y%m%d')
+        self.store_stats = StoreStats()
+        self.price_cache = PriceCache()
+        self.financial_cache = FinancialCache()
+        self.refresh_planner = DartRefreshPlanner(self.dart_api_key) if self.dart_api_key else None
                        
     def get_universe(self):
         """Get KOSPI 200 and KOSDAQ 150 stock tickers."""
@@ -48,17 +58,60 @@ class DataManager:
             return []
         
     @rate_limited(calls_per_second=2)
-    def get_ohlcv(self, ticker, days=400):
-        """Get OHLCV data for a ticker."""
+    def _fetch_ohlcv(self, ticker, start_date, end_date):
+        """Fetch OHLCV data for a ticker from pykrx."""
         try:
-            end_date = datetime.now().strftime('%Y%m%d')
-            start_date = (datetime.now() - timedelta(days=days)).strftime('%Y%m%d')
-            df = stock.get_market_ohlcv_by_date(start_date, end_date, ticker)
-            return df
+            return stock.get_market_ohlcv_by_date(start_date, end_date, ticker)
         except Exception as e:
             logger.debug(f"Error fetching OHLCV for {ticker}: {e}")
             return pd.DataFrame()
     
+    def _rebuild_ohlcv(self, ticker, start_date, end_date):
+        """Fetch a ticker's full history and replace its cached copy."""
+        df = self._fetch_ohlcv(ticker, start_date, end_date)
+        self.price_cache.save(ticker, df, rebuilt=True, fetched_from=start_date)
+        return df
+    
+    def get_ohlcv(self, ticker, days=400):
+        """
+        Get OHLCV data for a ticker.
+        
+        Only bars newer than the cached history are fetched. If a split or other
+        price adjustment is detected, the ticker's history is refetched in full.
+        """
+        end_date = datetime.now().strftime('%Y%m%d')
+        start_date = (datetime.now() - timedelta(days=days)).strftime('%Y%m%d')
+        
+        cached = self.price_cache.load(ticker)
+        
+        if cached is None or not self.price_cache.covers(ticker, start_date):
+            self.store_stats.record('price_cache', 'miss')
+            df = self._rebuild_ohlcv(ticker, start_date, end_date)
+        elif self.price_cache.has_pending_action(ticker):
+            logger.info(f"Corporate action recorded for {ticker}; rebuilding price history")
+            self.store_stats.record('price_cache', 'rebuild')
+            df = self._rebuild_ohlcv(ticker, start_date, end_date)
+        else:
+            fresh = self._fetch_ohlcv(ticker, self.price_cache.overlap_start(cached), end_date)
+            if fresh.empty:
+                self.store_stats.record('price_cache', 'hit')
+                df = cached
+            elif self.price_cache.has_discontinuity(cached, fresh):
+                logger.info(f"Price adjustment detected for {ticker}; rebuilding price history")
+                self.store_stats.record('price_cache', 'rebuild')
+                df = self._rebuild_ohlcv(ticker, start_date, end_date)
+            else:
+                self.store_stats.record('price_cache', 'hit')
+                df = self.price_cache.merge(cached, fresh)
+                # Holidays and reruns bring no new bars; skip rewriting the cache
+                if fresh.index[-1] > cached.index[-1]:
+                    self.price_cache.save(ticker, df)
+        
+        if df.empty:
+            return df
+        return df[df.index >= pd.Timestamp(start_date)]
+    
+    @rate_limited(calls_per_second=2)
     def get_company_name(self, ticker):
         """Get company name for a ticker."""
         try:
@@ -66,12 +119,45 @@ class DataManager:
         except:
             return ticker
     
-    @rate_limited(calls_per_second=1)
+    def plan_dart_refresh(self, tickers):
+        """
+        Check DART's daily disclosure list once and queue refreshes for new filers.
+        
+        Returns: set of tickers whose financial statements will be refetched
+        """
+        if not self.refresh_planner:
+            return set()
+        return self.refresh_planner.plan(tickers)
+    
     def get_financial_statements(self, ticker):
-        """Get financial statements from DART for a company."""
+        """
+        Get financial statements for a company.
+        
+        Cached statements are reused unless the company filed a new periodic
+        report since they were fetched (see plan_dart_refresh).
+        """
         if not self.dart_api_key:
             return None
         
+        cached = self.financial_cache.load(ticker)
+        if cached is not None and not self.refresh_planner.needs_refresh(ticker):
+            self.store_stats.record('dart_cache', 'hit')
+            return cached
+        
+        self.store_stats.record('dart_cache', 'miss' if cached is None else 'refresh')
+        fs = self._fetch_financial_statements(ticker)
+        if isinstance(fs, pd.DataFrame):
+            self.financial_cache.save(ticker, fs)
+            self.refresh_planner.mark_refreshed(ticker)
+            return fs
+        
+        # Keep serving the last known statements if the refetch failed
+        return cached if cached is not None else fs
+    
+    @rate_limited(calls_per_second=1)
+    def _fetch_financial_statements(self, ticker):
+        """Fetch financial statements from DART for a company."""
+        
         try:
             # Get the company's corporate code using OpenDartReader module functions
             corp_list = OpenDartReader.company_by_name(ticker)
@@ -110,6 +196,22 @@ class DataManager:
             logger.debug(f"Error fetching financials for {ticker}: {e}")
             return None
     
+    def get_fundamentals(self):
+        """
+        Get market-wide fundamentals, fetched once per run.
+        
+        The lock makes concurrent fetch workers wait for the first fetch
+        instead of each requesting the whole market.
+        """
+        with self._fundamentals_lock:
+            if self._fundamentals is None:
+                try:
+                    self._fundamentals = stock.get_market_fundamental_by_ticker(self.today, market="ALL")
+                except Exception as e:
+                    logger.warning(f"Error fetching market fundamentals: {e}")
+                    self._fundamentals = pd.DataFrame()
+            return self._fundamentals
+    
     def get_market_data(self, ticker):
         """Get comprehensive market data for a stock."""
         try:
@@ -118,7 +220,7 @@ class DataManager:
                 return None
             
             # Get fundamental data if available
-            fundamentals = stock.get_market_fundamental_by_ticker(self.today, market="ALL")
+            fundamentals = self.get_fundamentals()
             
             data = {
                 'ticker': ticker,
@@ -0,0 +1,186 @@
+import hashlib
+import json
+import threading
+import pandas as pd
+from datetime import datetime
+from pathlib import Path
+from utils import setup_logger
+
+logger = setup_logger('file_cache')
+
+class TickerFileCache:
+    """
+    On-disk cache of one CSV per ticker, tracked by a checksummed JSON index.
+
+    Subclasses supply the CSV read and write options, the columns a usable file
+    must have, and any metadata derived from the data itself.
+    """
+
+    # Bump when the CSV layout or index format changes
+    SCHEMA_VERSION = 1
+
+    # Name used in log messages
+    NAME = 'file cache'
+
+    # Keyword arguments for pd.read_csv and DataFrame.to_csv
+    READ_OPTIONS = {}
+    WRITE_OPTIONS = {}
+
+    # Columns a cached file must contain to be usable
+    REQUIRED_COLUMNS = ()
+
+    # Index entry dates that default to today on save, or to the file's
+    # modification date when the index is rebuilt
+    DATE_FIELDS = ()
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.cache_dir / 'index.json'
+        self.index = self._load_index()
+        # Guards the shared index when several fetch workers update the cache
+        self.lock = threading.Lock()
+
+    def _load_index(self):
+        """Load per-ticker metadata (dates, checksum)."""
+        if not self.index_file.exists():
+            return {}
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning(f"{self.NAME.capitalize()} index unreadable, starting fresh: {e}")
+            return {}
+
+        if data.get('schema_version') != self.SCHEMA_VERSION:
+            logger.warning(f"{self.NAME.capitalize()} schema {data.get('schema_version')} is not "
+                           f"{self.SCHEMA_VERSION}; starting fresh")
+            return {}
+        return data['tickers']
+
+    def _save_index(self):
+        tmp_file = self.index_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'schema_version': self.SCHEMA_VERSION, 'tickers': self.index},
+                      f, ensure_ascii=False, indent=2)
+        tmp_file.replace(self.index_file)
+
+    def _path(self, ticker):
+        return self.cache_dir / f"{ticker}.csv"
+
+    def _read(self, path):
+        """Read a cached file, rejecting one that lacks the required columns."""
+        df = pd.read_csv(path, encoding='utf-8', **self.READ_OPTIONS)
+        missing = [c for c in self.REQUIRED_COLUMNS if c not in df.columns]
+        if missing:
+            raise ValueError(f"missing columns {missing}")
+        return df
+
+    def _describe(self, df):
+        """Return index metadata derived from the cached data itself."""
+        return {}
+
+    def _problems(self, df):
+        """Return problems in a readable cached file beyond its checksum."""
+        return []
+
+    def _entry(self, df, content, previous, default_date, fields):
+        entry = {field: default_date for field in self.DATE_FIELDS}
+        entry.update(previous)
+        entry.update(self._describe(df))
+        entry.update(fields)
+        entry['sha256'] = hashlib.sha256(content).hexdigest()
+        return entry
+
+    def load(self, ticker):
+        """Return a ticker's cached data, or None if not cached."""
+        path = self._path(ticker)
+        if ticker not in self.index or not path.exists():
+            return None
+        try:
+            return self._read(path)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable {self.NAME} for {ticker}: {e}")
+            self.invalidate(ticker)
+            return None
+
+    def save(self, ticker, df, **fields):
+        """
+        Write a ticker's data atomically and update its index entry.
+
+        Args:
+            fields: index entry values to set, replacing any previous ones
+        """
+        if not isinstance(df, pd.DataFrame) or df.empty:
+            return
+
+        content = df.to_csv(**self.WRITE_OPTIONS).encode('utf-8')
+        tmp_path = self._path(ticker).with_suffix('.tmp')
+        tmp_path.write_bytes(content)
+        tmp_path.replace(self._path(ticker))
+
+        today = datetime.now().strftime('%Y%m%d')
+        with self.lock:
+            self.index[ticker] = self._entry(df, content, self.index.get(ticker, {}), today, fields)
+            self._save_index()
+
+    def invalidate(self, ticker):
+        """Drop a ticker's cached data."""
+        with self.lock:
+            self.index.pop(ticker, None)
+            self._path(ticker).unlink(missing_ok=True)
+            self._save_index()
+
+    def tickers(self):
+        """Return all tickers in the index."""
+        return sorted(self.index)
+
+    def verify(self, ticker):
+        """
+        Check a cached ticker against its index entry.
+
+        Returns: list of problem descriptions, empty if the entry is intact
+        """
+        entry = self.index.get(ticker)
+        path = self._path(ticker)
+        if entry is None:
+            return ['not in index']
+        if not path.exists():
+            return ['file missing']
+
+        problems = []
+        if hashlib.sha256(path.read_bytes()).hexdigest() != entry.get('sha256'):
+            problems.append('checksum mismatch')
+        try:
+            problems.extend(self._problems(self._read(path)))
+        except Exception as e:
+            problems.append(f"unreadable: {e}")
+        return problems
+
+    def rebuild_index(self):
+        """
+        Rebuild the index from the CSV files on disk.
+
+        Unreadable files are removed. Dates already recorded for a ticker are
+        kept; otherwise the file's modification date is used.
+
+        Returns: number of tickers indexed
+        """
+        index = {}
+        for path in sorted(self.cache_dir.glob('*.csv')):
+            ticker = path.stem
+            try:
+                content = path.read_bytes()
+                df = self._read(path)
+            except Exception as e:
+                logger.warning(f"Removing unreadable {self.NAME} for {ticker}: {e}")
+                path.unlink()
+                continue
+
+            modified = datetime.fromtimestamp(path.stat().st_mtime).strftime('%Y%m%d')
+            index[ticker] = self._entry(df, content, self.index.get(ticker, {}), modified, {})
+
+        with self.lock:
+            self.index = index
+            self._save_index()
+        return len(index)
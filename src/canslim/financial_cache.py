@@ -0,0 +1,20 @@
+from datetime import datetime
+from .file_cache import TickerFileCache
+
+class FinancialCache(TickerFileCache):
+    """On-disk cache of DART financial statements, one CSV per ticker."""
+
+    NAME = 'financial cache'
+    # DART fields are strings; keep rcept_no, reprt_code etc. as-is
+    READ_OPTIONS = {'dtype': str}
+    WRITE_OPTIONS = {'index': False}
+    # Columns the earnings analyzer depends on
+    REQUIRED_COLUMNS = ('rcept_no', 'account_nm', 'thstrm_amount')
+    DATE_FIELDS = ('fetched_at',)
+
+    def __init__(self, cache_dir='data/dart_cache'):
+        super().__init__(cache_dir)
+
+    def save(self, ticker, df):
+        """Write a ticker's financial statements."""
+        super().save(ticker, df, fetched_at=datetime.now().strftime('%Y%m%d'))
@@ -0,0 +1,138 @@
+import pandas as pd
+from datetime import datetime
+from pathlib import Path
+from utils import setup_logger
+from .file_cache import TickerFileCache
+
+logger = setup_logger('price_cache')
+
+class PriceCache(TickerFileCache):
+    """
+    Incremental on-disk OHLCV cache.
+
+    pykrx returns split-adjusted prices, so a split or rights issue rewrites a
+    ticker's entire history. A cached ticker is rebuilt from scratch when either
+    the freshly fetched overlap bars disagree with the cached ones, or the local
+    corporate-action table lists an event newer than the cached history.
+    """
+
+    NAME = 'price cache'
+    READ_OPTIONS = {'index_col': 0, 'parse_dates': True}
+    REQUIRED_COLUMNS = ('시가', '고가', '저가', '종가', '거래량')
+    DATE_FIELDS = ('rebuilt_at',)
+
+    def __init__(self, cache_dir='data/price_cache', actions_file='data/corporate_actions.csv',
+                 overlap_days=5, tolerance=0.005):
+        super().__init__(cache_dir)
+        self.actions_file = Path(actions_file)
+        self.overlap_days = overlap_days
+        self.tolerance = tolerance
+        self.actions = self._load_actions()
+
+    def _load_actions(self):
+        """
+        Load the local corporate-action table.
+
+        Expected CSV columns: ticker, date (YYYYMMDD), action (e.g. split, rights).
+
+        Returns: dict mapping ticker to a sorted list of event dates
+        """
+        if not self.actions_file.exists():
+            return {}
+        try:
+            df = pd.read_csv(self.actions_file, dtype={'ticker': str, 'date': str})
+            actions = {}
+            for ticker, group in df.groupby('ticker'):
+                actions[ticker.zfill(6)] = sorted(group['date'].tolist())
+            return actions
+        except Exception as e:
+            logger.warning(f"Error reading corporate actions from {self.actions_file}: {e}")
+            return {}
+
+    def _read(self, path):
+        """
+        Read a cached history, rejecting files damaged by a partial write.
+
+        A junk row makes read_csv fall back to a plain object index, so the
+        index type is checked explicitly.
+        """
+        df = super()._read(path)
+        if not isinstance(df.index, pd.DatetimeIndex):
+            raise ValueError('index is not a date index')
+        if df.empty:
+            raise ValueError('empty history')
+        return df
+
+    def _describe(self, df):
+        return {
+            'last_date': df.index[-1].strftime('%Y%m%d'),
+            'first_date': df.index[0].strftime('%Y%m%d')
+        }
+
+    def _problems(self, df):
+        if not df.index.is_monotonic_increasing or df.index.has_duplicates:
+            return ['bars not sorted or duplicated']
+        return []
+
+    def save(self, ticker, df, rebuilt=False, fetched_from=None):
+        """
+        Write a ticker's full history and update its metadata.
+
+        Args:
+            rebuilt: True if df is a full refetch rather than an incremental update
+            fetched_from: Start date (YYYYMMDD) the history was requested from;
+                kept from the previous save if not given
+        """
+        fields = {}
+        if rebuilt:
+            fields['rebuilt_at'] = datetime.now().strftime('%Y%m%d')
+        if fetched_from is not None:
+            fields['fetched_from'] = fetched_from
+        super().save(ticker, df, **fields)
+
+    def covers(self, ticker, start_date):
+        """
+        Check if the cached history was fetched from start_date (YYYYMMDD) or earlier.
+
+        A recently listed ticker's first bar is later than any start date before
+        its listing, so coverage is judged by the requested start of the last
+        full fetch rather than by the first cached bar.
+        """
+        entry = self.index.get(ticker)
+        if not entry:
+            return False
+        return entry.get('fetched_from', entry['first_date']) <= start_date
+
+    def has_pending_action(self, ticker):
+        """Check if a corporate action occurred after the cached history was last rebuilt."""
+        entry = self.index.get(ticker)
+        if not entry:
+            return False
+        today = datetime.now().strftime('%Y%m%d')
+        return any(entry['rebuilt_at'] < date <= today for date in self.actions.get(ticker, []))
+
+    def overlap_start(self, cached):
+        """First date to refetch so the fresh data overlaps the cached tail."""
+        return cached.index[-min(self.overlap_days, len(cached))].strftime('%Y%m%d')
+
+    def has_discontinuity(self, cached, fresh):
+        """
+        Compare closing prices on dates present in both frames.
+
+        Returns: True if any overlapping close differs by more than the tolerance,
+        or if the frames do not overlap at all
+        """
+        common = cached.index.intersection(fresh.index)
+        if len(common) == 0:
+            return True
+
+        old_close = cached.loc[common, '종가'].astype(float)
+        new_close = fresh.loc[common, '종가'].astype(float)
+        rel_diff = ((new_close - old_close).abs() / old_close.abs().where(old_close != 0)).fillna(0)
+        return bool((rel_diff > self.tolerance).any())
+
+    @staticmethod
+    def merge(cached, fresh):
+        """Append fresh bars to the cached history, preferring fresh values on overlap."""
+        merged = pd.concat([cached[~cached.index.isin(fresh.index)], fresh])
+        return merged.sort_index()
@@ -4,6 +4,7 @@ CANSLIM + Turtle Trading Stock Screener for Korean Market
 Main execution script
 """
 
+import argparse
 import json
 import os
 from datetime import datetime
@@ -22,173 +23,280 @@ from canslim import (
     LeadershipAnalyzer
 )
 from turtle import TurtleSignalGenerator
-from utils import setup_logger
+from strategies import get_strategy_classes
+from utils import (
+    setup_logger,
+    select_shard,
+    ResultStore,
+    ResultWriter,
+    compute_fingerprint,
+    run_pipeline,
+    prioritize,
+    Deadline
+)
 
 logger = setup_logger('main')
 
 class StockScreener:
     """Main screener orchestrator."""
     
-    def __init__(self):
+    def __init__(self, strategy_names=None):
         logger.info("Initializing Stock Screener...")
         self.data_manager = DataManager()
-        self.earnings_analyzer = EarningsAnalyzer(self.data_manager)
-        self.newness_analyzer = NewnessAnalyzer()
-        self.supply_analyzer = SupplyAnalyzer()
-        self.leadership_analyzer = LeadershipAnalyzer(self.data_manager)
-        self.turtle_generator = TurtleSignalGenerator()
+        self.analyzers = {
+            'earnings': EarningsAnalyzer(self.data_manager),
+            'newness': NewnessAnalyzer(),
+            'supply': SupplyAnalyzer(),
+            'leadership': LeadershipAnalyzer(self.data_manager),
+            'turtle': TurtleSignalGenerator()
+        }
         
         # Check if L criterion is available
-        self.use_l_criterion = self.leadership_analyzer.is_available()
-        if not self.use_l_criterion:
+        if not self.analyzers['leadership'].is_available():
             logger.info("L (Leadership) criterion excluded - sector data unavailable")
+        
+        self.strategies = [cls(self.analyzers) for cls in get_strategy_classes(strategy_names)]
+        logger.info(f"Strategies: {', '.join(s.name for s in self.strategies)}")
+        
+        # Only fetch DART financials if some strategy needs them
+        self.requires = set()
+        for strategy in self.strategies:
+            self.requires.update(strategy.requires)
+        
+        self.result_stores = {
+            s.name: ResultStore(f'data/results/{s.name}.json') for s in self.strategies
+        }
+        self.status_changes = {s.name: [] for s in self.strategies}
+        self.reused_counts = {s.name: 0 for s in self.strategies}
+    
+    def load_stock_data(self, ticker):
+        """
+        Load everything any registered strategy needs for a stock, once.
+        
+        Returns: dict with 'name', 'close_price', 'ohlcv' and optionally
+        'financials', or None if no price data is available
+        """
+        market_data = self.data_manager.get_market_data(ticker)
+        if not market_data or market_data['ohlcv'].empty:
+            return None
+        
+        data = {
+            'name': market_data['name'],
+            'close_price': market_data['close_price'],
+            'ohlcv': market_data['ohlcv']
+        }
+        if 'financials' in self.requires:
+            data['financials'] = self.data_manager.get_financial_statements(ticker)
+        return data
     
     def screen_stock(self, ticker):
         """
-        Screen a single stock through all CANSLIM criteria.
+        Screen a single stock through every registered strategy.
         
-        Returns: dict with screening results or None if stock fails
+        Returns: dict mapping strategy name to its result, or None if data is unavailable
         """
         try:
-            # Get market data
-            market_data = self.data_manager.get_market_data(ticker)
-            if not market_data or market_data['ohlcv'].empty:
-                return None
-            
-            ohlcv = market_data['ohlcv']
-            company_name = market_data['name']
-            close_price = market_data['close_price']
-            
-            # Initialize result
-            result = {
-                'ticker': ticker,
-                'company_name': company_name,
-                'close_price': close_price,
-                'canslim_score': 0,
-                'criteria': {}
-            }
-            
-            # Get financial data for C and A criteria
-            financial_data = self.data_manager.get_financial_statements(ticker)
-            
-            # Check C - Current Earnings
-            c_pass, c_details = self.earnings_analyzer.check_c_criterion(ticker, financial_data)
-            result['criteria']['C'] = {'pass': c_pass, 'details': c_details}
-            if c_pass:
-                result['canslim_score'] += 1
-            
-            # Check A - Annual Earnings
-            a_pass, a_details = self.earnings_analyzer.check_a_criterion(ticker, financial_data)
-            result['criteria']['A'] = {'pass': a_pass, 'details': a_details}
-            if a_pass:
-                result['canslim_score'] += 1
-            
-            # Check N - Newness
-            n_pass, n_details = self.newness_analyzer.check_n_criterion(ticker, ohlcv)
-            result['criteria']['N'] = {'pass': n_pass, 'details': n_details}
-            if n_pass:
-                result['canslim_score'] += 1
-            
-            # Check S - Supply and Demand (Mandatory)
-            s_pass, s_details = self.supply_analyzer.check_s_criterion(ticker, ohlcv)
-            result['criteria']['S'] = {'pass': s_pass, 'details': s_details}
-            if s_pass:
-                result['canslim_score'] += 1
-            
-            # Check L - Leadership (if available)
-            if self.use_l_criterion:
-                l_pass, l_details = self.leadership_analyzer.check_l_criterion(ticker, ohlcv, None)
-                result['criteria']['L'] = {'pass': l_pass, 'details': l_details}
-                if l_pass:
-                    result['canslim_score'] += 1
-            
-            # Determine if stock passes all required criteria
-            required_criteria = ['C', 'A', 'N', 'S']
-            if self.use_l_criterion:
-                required_criteria.append('L')
-            
-            all_pass = all(result['criteria'][c]['pass'] for c in required_criteria)
-            result['cansl_pass'] = all_pass
-            
-            # If stock passes CANSL, check Turtle signals
-            if all_pass:
-                turtle_signals = self.turtle_generator.generate_signals(ticker, ohlcv)
-                result['turtle_signals'] = turtle_signals
-            else:
-                result['turtle_signals'] = []
-            
-            return result
-            
+            data = self.load_stock_data(ticker)
         except Exception as e:
-            logger.error(f"Error screening {ticker}: {e}")
+            logger.error(f"Error loading data for {ticker}: {e}")
             return None
+        return self.evaluate_strategies(ticker, data)
     
-    def run(self):
-        """Execute the full screening process."""
+    def evaluate_strategies(self, ticker, data):
+        """
+        Evaluate already loaded data with every registered strategy.
+        
+        Each strategy's result is memoized by a fingerprint of the inputs it uses,
+        so a stock with no new bar, filing or configuration change reuses its
+        last result.
+        
+        Returns: dict mapping strategy name to its result, or None if data is unavailable
+        """
+        if data is None:
+            return None
+        
+        results = {}
+        for strategy in self.strategies:
+            try:
+                financials = data.get('financials') if 'financials' in strategy.requires else None
+                fingerprint = compute_fingerprint(data['ohlcv'], financials, strategy.get_config())
+                
+                store = self.result_stores[strategy.name]
+                result = store.lookup(ticker, fingerprint)
+                if result is not None:
+                    self.reused_counts[strategy.name] += 1
+                    self.data_manager.store_stats.record(f'results/{strategy.name}', 'hit')
+                else:
+                    self.data_manager.store_stats.record(f'results/{strategy.name}', 'miss')
+                    result = strategy.evaluate(ticker, data)
+                
+                # Stocks that stop passing get no Turtle signals, but an open
+                # position must still see its exit
+                position_signals = None
+                if not result['passed'] and store.has_open_position(ticker):
+                    position_signals = self.analyzers['turtle'].generate_signals(ticker, data['ohlcv'])
+                
+                change = store.update(ticker, fingerprint, result, position_signals)
+                if change:
+                    self.status_changes[strategy.name].append({
+                        'Ticker': ticker,
+                        'CompanyName': result['company_name'],
+                        'Previous': change['previous'],
+                        'Current': change['current']
+                    })
+                
+                results[strategy.name] = result
+                
+            except Exception as e:
+                logger.error(f"Error screening {ticker} with {strategy.name}: {e}")
+        
+        return results
+    
+    def run(self, shard_index=0, shard_count=1, fetch_workers=2, time_budget=None):
+        """
+        Execute the screening process.
+        
+        Fetching, analysis and output run as a streaming pipeline: while one
+        stock is analyzed the next ones are already being fetched, and passing
+        stocks are streamed to results/<name>.jsonl as they are found.
+        
+        Args:
+            shard_index: Zero-based index of the universe slice to screen
+            shard_count: Total number of shards (1 screens the whole universe)
+            fetch_workers: Number of concurrent data fetch threads
+            time_budget: Wall-clock budget in seconds; when it runs out, no new
+                stocks are started and partial results are written
+        """
+        deadline = Deadline(time_budget)
         logger.info("=" * 60)
         logger.info("Starting CANSLIM + Turtle Trading Screener")
         logger.info("=" * 60)
         
         # Get stock universe
-        tickers = self.data_manager.get_universe()
+        universe = sorted(self.data_manager.get_universe())
+        tickers = universe
+        if shard_count > 1:
+            tickers = select_shard(universe, shard_index, shard_count)
+            logger.info(f"Shard {shard_index + 1}/{shard_count}: {len(tickers)} of {len(universe)} stocks")
         logger.info(f"Screening {len(tickers)} stocks...")
         
+        if 'financials' in self.requires:
+            self.data_manager.plan_dart_refresh(tickers)
+        
+        # Screen prior CANSLIM passes, near-misses and open positions before the rest
+        pass_stores = [self.result_stores[s.name] for s in self.strategies if s.schedule_priority]
+        tickers = prioritize(tickers, pass_stores or self.result_stores.values(),
+                             self.result_stores.values())
+        
+        output_files = {}
+        for strategy in self.strategies:
+            output_file = strategy.get_output_file()
+            if shard_count > 1:
+                output_file = f"shards/{Path(output_file).stem}.shard-{shard_index}.json"
+            output_files[strategy.name] = output_file
+        
         # Screen all stocks
-        cansl_passed = []
-        turtle_signals = []
+        passed = {s.name: [] for s in self.strategies}
+        turtle_signals = {s.name: [] for s in self.strategies}
+        writers = {
+            name: ResultWriter(Path('results') / Path(output_file).with_suffix('.jsonl'))
+            for name, output_file in output_files.items()
+        }
+        screened = set()
         
-        for idx, ticker in enumerate(tickers, 1):
-            if idx % 10 == 0:
-                logger.info(f"Progress: {idx}/{len(tickers)} stocks processed")
-            
-            result = self.screen_stock(ticker)
+        def emit(ticker, results):
+            screened.add(ticker)
+            if len(screened) % 10 == 0:
+                logger.info(f"Progress: {len(screened)}/{len(tickers)} stocks processed")
+            if not results:
+                return
             
-            if result and result['cansl_pass']:
-                # Stock passed all CANSL criteria
-                cansl_stock = {
+            for strategy in self.strategies:
+                result = results.get(strategy.name)
+                if not result or not result['passed']:
+                    continue
+                
+                # Stock passed all of the strategy's criteria
+                stock = {
                     'Ticker': result['ticker'],
                     'CompanyName': result['company_name'],
                     'ClosePrice': int(result['close_price']),
-                    'CANSLIM_Score': result['canslim_score']
+                    strategy.score_field: result['score']
                 }
-                cansl_passed.append(cansl_stock)
+                passed[strategy.name].append(stock)
                 
                 # Check for Turtle signals
-                if result['turtle_signals']:
-                    for signal in result['turtle_signals']:
-                        turtle_signals.append({
-                            'Ticker': result['ticker'],
-                            'CompanyName': result['company_name'],
-                            'ClosePrice': int(result['close_price']),
-                            'CANSLIM_Score': result['canslim_score'],
-                            'Turtle_Signal': signal
-                        })
-        
-        # Prepare output
-        output = {
-            'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S KST'),
-            'cansl_passed': cansl_passed,
-            'turtle_signals': turtle_signals
-        }
+                for signal in result['turtle_signals']:
+                    turtle_signals[strategy.name].append(dict(stock, Turtle_Signal=signal))
+                
+                writers[strategy.name].write(dict(stock, Turtle_Signals=result['turtle_signals']))
+        
+        try:
+            stats = run_pipeline(tickers, self.load_stock_data, self.evaluate_strategies, emit,
+                                 fetch_workers=fetch_workers, should_stop=deadline.expired)
+        finally:
+            for writer in writers.values():
+                writer.close()
+        
+        logger.info(f"Pipeline busy time - fetch: {stats['fetch_time']}s, "
+                    f"analyze: {stats['analyze_time']}s, emit: {stats['emit_time']}s")
         
-        # Save results
-        self.save_results(output)
+        # Prepare and save one result set per strategy
+        last_updated = datetime.now().strftime('%Y-%m-%d %H:%M:%S KST')
+        unscreened = sorted(set(tickers) - screened)
+        coverage = {
+            'complete': not unscreened,
+            'screened': len(screened),
+            'total': len(tickers),
+            'unscreened': unscreened
+        }
+        outputs = {}
         
-        # Log summary
         logger.info("=" * 60)
-        logger.info("Screening Complete!")
-        logger.info(f"CANSL Passed: {len(cansl_passed)} stocks")
-        logger.info(f"Turtle Signals: {len(turtle_signals)} signals")
+        if unscreened:
+            logger.warning(f"Screening Incomplete! Time budget exhausted after "
+                           f"{len(screened)}/{len(tickers)} stocks; results are partial")
+        else:
+            logger.info("Screening Complete!")
+        
+        for strategy in self.strategies:
+            # Pipeline output arrives in completion order; keep files stable between runs
+            passed[strategy.name].sort(key=lambda s: s['Ticker'])
+            turtle_signals[strategy.name].sort(key=lambda s: (s['Ticker'], s['Turtle_Signal']))
+            self.status_changes[strategy.name].sort(key=lambda s: s['Ticker'])
+            
+            output = {
+                'last_updated': last_updated,
+                'strategy': strategy.name,
+                strategy.passed_key: passed[strategy.name],
+                'turtle_signals': turtle_signals[strategy.name],
+                'status_changes': self.status_changes[strategy.name],
+                'coverage': coverage
+            }
+            if shard_count > 1:
+                # The full universe lets the merge account for shards that never report
+                output['shard'] = {'index': shard_index, 'count': shard_count,
+                                   'tickers': len(tickers), 'universe': universe}
+            
+            self.result_stores[strategy.name].save()
+            self.save_results(output, output_files[strategy.name])
+            outputs[strategy.name] = output
+            
+            logger.info(f"[{strategy.name}] Passed: {len(passed[strategy.name])} stocks, "
+                        f"Turtle Signals: {len(turtle_signals[strategy.name])}, "
+                        f"Status Changes: {len(self.status_changes[strategy.name])}, "
+                        f"Reused Results: {self.reused_counts[strategy.name]}")
+        
         logger.info("=" * 60)
         
-        return output
+        self.data_manager.store_stats.save()
+        
+        return outputs
     
-    def save_results(self, output):
+    def save_results(self, output, filename='screener_results.json'):
         """Save screening results to JSON file."""
-        results_dir = Path('results')
-        results_dir.mkdir(exist_ok=True)
-        
-        output_file = results_dir / 'screener_results.json'
+        output_file = Path('results') / filename
+        output_file.parent.mkdir(parents=True, exist_ok=True)
         
         with open(output_file, 'w', encoding='utf-8') as f:
             json.dump(output, f, ensure_ascii=False, indent=2)
@@ -196,11 +304,34 @@ class StockScreener:
         logger.info(f"Results saved to {output_file}")
 
 
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description='CANSLIM + Turtle Trading Stock Screener')
+    parser.add_argument('--shard-index', type=int, default=0,
+                        help='Zero-based index of the universe slice to screen')
+    parser.add_argument('--shard-count', type=int, default=1,
+                        help='Total number of shards; merge partial results with merge_shards.py')
+    parser.add_argument('--fetch-workers', type=int, default=2,
+                        help='Number of concurrent data fetch threads')
+    parser.add_argument('--time-budget', type=float, default=None,
+                        help='Wall-clock budget in minutes; stops cleanly and writes partial results')
+    parser.add_argument('--strategies', type=lambda value: value.split(','), default=None,
+                        help='Comma-separated strategy names to run (default: all registered)')
+    args = parser.parse_args()
+    
+    if args.shard_count < 1 or not 0 <= args.shard_index < args.shard_count:
+        parser.error(f"--shard-index must be in [0, {args.shard_count})")
+    return args
+
+
 def main():
     """Main entry point."""
+    args = parse_args()
     try:
-        screener = StockScreener()
-        screener.run()
+        screener = StockScreener(strategy_names=args.strategies)
+        screener.run(shard_index=args.shard_index, shard_count=args.shard_count,
+                     fetch_workers=args.fetch_workers,
+                     time_budget=args.time_budget * 60 if args.time_budget else None)
     except Exception as e:
         logger.error(f"Fatal error: {e}", exc_info=True)
         raise
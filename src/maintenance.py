@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Maintenance commands for the screener's local data stores
+
+Stores under data/:
+- price_cache/   per-ticker OHLCV history (PriceCache)
+- dart_cache/    per-ticker DART financial statements (FinancialCache)
+- results/       memoized screen results per strategy (ResultStore)
+"""
+
+import argparse
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+
+# Add src directory to Python path
+src_dir = Path(__file__).parent
+sys.path.insert(0, str(src_dir))
+
+import pandas as pd
+
+from canslim import DataManager, PriceCache, FinancialCache, DartRefreshPlanner
+from utils import setup_logger, ResultStore, StoreStats
+
+logger = setup_logger('maintenance')
+
+DATA_DIR = Path('data')
+
+# get_ohlcv reads 400 calendar days of history
+MIN_RETENTION_DAYS = 400
+
+def open_stores():
+    """Open every local data store."""
+    return {
+        'price_cache': PriceCache(),
+        'dart_cache': FinancialCache(),
+        'results': {
+            path.stem: ResultStore(path) for path in sorted((DATA_DIR / 'results').glob('*.json'))
+        }
+    }
+
+def dir_size(path):
+    """Return (file count, total bytes) of a directory."""
+    files = [p for p in Path(path).glob('*') if p.is_file()]
+    return len(files), sum(p.stat().st_size for p in files)
+
+def hit_rate(counts):
+    """Format a hit rate from a dict of event counts."""
+    lookups = sum(counts.values())
+    if not lookups:
+        return 'n/a'
+    return f"{counts.get('hit', 0) / lookups * 100:.1f}% of {lookups}"
+
+def cmd_stats(args):
+    """Report per-store size and hit rates."""
+    stores = open_stores()
+    stats = StoreStats().load()
+
+    logger.info(f"Last run: {stats.get('last_run') or 'never'}")
+    rows = [
+        ('price_cache', stores['price_cache'].cache_dir, len(stores['price_cache'].tickers())),
+        ('dart_cache', stores['dart_cache'].cache_dir, len(stores['dart_cache'].tickers()))
+    ]
+    for name, store in stores['results'].items():
+        rows.append((f'results/{name}', store.store_file, len(store.entries)))
+
+    for name, path, entries in rows:
+        if path.is_dir():
+            files, size = dir_size(path)
+        else:
+            files, size = (1, path.stat().st_size) if path.exists() else (0, 0)
+        counts = stats['stores'].get(name, {'last_run': {}, 'total': {}})
+        logger.info(f"{name}: {entries} entries, {files} files, {size / 1024:.1f} KiB, "
+                    f"hit rate last run {hit_rate(counts['last_run'])}, "
+                    f"overall {hit_rate(counts['total'])}")
+
+def cmd_verify(args):
+    """Check checksums and schema versions; optionally drop broken entries."""
+    stores = open_stores()
+    broken = 0
+
+    for name in ('price_cache', 'dart_cache'):
+        cache = stores[name]
+        for ticker in cache.tickers():
+            problems = cache.verify(ticker)
+            if problems:
+                broken += 1
+                logger.warning(f"{name}/{ticker}: {', '.join(problems)}")
+                if args.fix:
+                    cache.invalidate(ticker)
+
+    for name, store in stores['results'].items():
+        problems = store.verify()
+        if problems:
+            broken += 1
+            logger.warning(f"results/{name}: {', '.join(problems)}")
+            if args.fix:
+                store.store_file.unlink()
+
+    if broken:
+        action = 'removed; they will be refetched' if args.fix else 'found; rerun with --fix to drop them'
+        logger.warning(f"{broken} broken entries {action}")
+        return 0 if args.fix else 1
+
+    logger.info("All stores verified")
+    return 0
+
+def cmd_compact(args):
+    """
+    Rewrite stores into clean, contiguous files.
+
+    Removes temp files left by interrupted writes and files no longer in an
+    index, and rewrites any price history whose bars are out of order or
+    duplicated.
+    """
+    stores = open_stores()
+    removed = 0
+
+    for tmp_file in DATA_DIR.glob('**/*.tmp'):
+        tmp_file.unlink()
+        removed += 1
+
+    for name in ('price_cache', 'dart_cache'):
+        cache = stores[name]
+        indexed = set(cache.tickers())
+        for path in cache.cache_dir.glob('*.csv'):
+            if path.stem not in indexed:
+                path.unlink()
+                removed += 1
+
+    price_cache = stores['price_cache']
+    rewritten = 0
+    for ticker in price_cache.tickers():
+        df = price_cache.load(ticker)
+        if df is None:
+            continue
+        if df.index.has_duplicates or not df.index.is_monotonic_increasing:
+            df = df[~df.index.duplicated(keep='last')].sort_index()
+            price_cache.save(ticker, df)
+            rewritten += 1
+
+    for store in stores['results'].values():
+        store.save()
+
+    logger.info(f"Compaction removed {removed} stray files and rewrote {rewritten} price histories")
+    return 0
+
+def cmd_prune(args):
+    """Drop delisted tickers and price history beyond the retention window."""
+    stores = open_stores()
+    price_cache = stores['price_cache']
+
+    cutoff = pd.Timestamp(datetime.now() - timedelta(days=args.retention_days))
+    trimmed = 0
+    for ticker in price_cache.tickers():
+        df = price_cache.load(ticker)
+        if df is not None and df.index[0] < cutoff:
+            price_cache.save(ticker, df[df.index >= cutoff], fetched_from=cutoff.strftime('%Y%m%d'))
+            trimmed += 1
+    logger.info(f"Trimmed price history older than {cutoff.date()} for {trimmed} tickers")
+
+    if args.keep_delisted:
+        return 0
+
+    universe = set(DataManager().get_universe())
+    if not universe:
+        # Trimming above succeeded; skipping this part is not a failure
+        logger.warning("Universe unavailable; skipping delisted ticker pruning")
+        return 0
+
+    cached = set(price_cache.tickers()) | set(stores['dart_cache'].tickers())
+    for store in stores['results'].values():
+        cached |= set(store.entries)
+    delisted = sorted(cached - universe)
+
+    refresh_planner = DartRefreshPlanner(None)
+    for ticker in delisted:
+        price_cache.invalidate(ticker)
+        stores['dart_cache'].invalidate(ticker)
+        refresh_planner.forget(ticker)
+    for store in stores['results'].values():
+        store.remove(delisted)
+        store.save()
+
+    logger.info(f"Pruned {len(delisted)} tickers no longer in the universe")
+    return 0
+
+def cmd_rebuild(args):
+    """Rebuild store indexes from the files on disk."""
+    stores = open_stores()
+    logger.info(f"price_cache: indexed {stores['price_cache'].rebuild_index()} tickers")
+    logger.info(f"dart_cache: indexed {stores['dart_cache'].rebuild_index()} tickers")
+    for name, store in stores['results'].items():
+        # Re-saving recomputes the checksum; an unreadable store loads empty
+        store.save()
+        logger.info(f"results/{name}: rewrote {len(store.entries)} entries")
+    return 0
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Maintain local screener data stores')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('stats', help='Report per-store size and hit rates')
+
+    verify = subparsers.add_parser('verify', help='Check checksums and schema versions')
+    verify.add_argument('--fix', action='store_true', help='Drop broken entries so they are refetched')
+
+    subparsers.add_parser('compact', help='Remove stray files and rewrite fragmented histories')
+
+    prune = subparsers.add_parser('prune', help='Drop delisted tickers and old price history')
+    prune.add_argument('--retention-days', type=int, default=800,
+                       help='Calendar days of price history to keep')
+    prune.add_argument('--keep-delisted', action='store_true',
+                       help='Only trim history; do not drop tickers missing from the universe')
+
+    subparsers.add_parser('rebuild', help='Rebuild store indexes from files on disk')
+
+    args = parser.parse_args()
+    if args.command == 'prune' and args.retention_days < MIN_RETENTION_DAYS:
+        parser.error(f"--retention-days must be at least {MIN_RETENTION_DAYS}")
+
+    commands = {
+        'stats': cmd_stats,
+        'verify': cmd_verify,
+        'compact': cmd_compact,
+        'prune': cmd_prune,
+        'rebuild': cmd_rebuild
+    }
+    sys.exit(commands[args.command](args) or 0)
+
+
+if __name__ == '__main__':
+    main()
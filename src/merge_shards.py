@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Merge per-shard screener outputs into one results file per strategy
+"""
+
+import argparse
+import json
+from collections import defaultdict
+from pathlib import Path
+import sys
+
+# Add src directory to Python path
+src_dir = Path(__file__).parent
+sys.path.insert(0, str(src_dir))
+
+from utils import setup_logger, merge_results
+
+logger = setup_logger('merge_shards')
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Merge sharded screener results')
+    parser.add_argument('shard_dir', nargs='?', default='results/shards',
+                        help='Directory containing <name>.shard-<index>.json files')
+    parser.add_argument('--output-dir', default='results',
+                        help='Directory for the merged <name>.json files')
+    args = parser.parse_args()
+
+    # Group shard files by result set, e.g. screener_results.shard-0.json -> screener_results
+    groups = defaultdict(list)
+    for shard_file in sorted(Path(args.shard_dir).glob('**/*.shard-*.json')):
+        groups[shard_file.name.split('.shard-')[0]].append(shard_file)
+
+    if not groups:
+        logger.error(f"No shard results found in {args.shard_dir}")
+        sys.exit(1)
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    for stem, shard_files in groups.items():
+        partials = []
+        for shard_file in shard_files:
+            with open(shard_file, 'r', encoding='utf-8') as f:
+                partials.append(json.load(f))
+
+        output = merge_results(partials)
+
+        output_file = output_dir / f"{stem}.json"
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+
+        logger.info(f"Merged {len(partials)} shards into {output_file}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,12 @@
+from .base import Strategy, register_strategy, get_strategy_classes, STRATEGY_REGISTRY
+from .canslim_strategy import CanslimStrategy
+from .momentum_strategy import MomentumStrategy
+
+__all__ = [
+    'Strategy',
+    'register_strategy',
+    'get_strategy_classes',
+    'STRATEGY_REGISTRY',
+    'CanslimStrategy',
+    'MomentumStrategy'
+]
\ No newline at end of file
@@ -0,0 +1,122 @@
+from utils import setup_logger
+
+logger = setup_logger('strategies')
+
+STRATEGY_REGISTRY = {}
+
+def register_strategy(cls):
+    """Class decorator that registers a strategy under its name."""
+    if not cls.name:
+        raise ValueError(f"{cls.__name__} must define a name")
+    if cls.name in STRATEGY_REGISTRY:
+        raise ValueError(f"Strategy '{cls.name}' is already registered")
+    STRATEGY_REGISTRY[cls.name] = cls
+    return cls
+
+def get_strategy_classes(names=None):
+    """
+    Look up registered strategies.
+
+    Args:
+        names: list of strategy names, or None for all registered strategies
+
+    Returns: list of strategy classes
+    """
+    if names is None:
+        return list(STRATEGY_REGISTRY.values())
+
+    unknown = [name for name in names if name not in STRATEGY_REGISTRY]
+    if unknown:
+        raise ValueError(f"Unknown strategies {unknown}; available: {sorted(STRATEGY_REGISTRY)}")
+    return [STRATEGY_REGISTRY[name] for name in names]
+
+class Strategy:
+    """
+    Base class for a named screen evaluated on shared per-ticker data.
+
+    Subclasses declare the data they need in `requires` ('ohlcv', 'financials'),
+    the criteria a stock must pass, and implement check_criterion().
+    Bump `version` when a strategy's thresholds or logic change so memoized
+    results are recomputed.
+    """
+
+    name = None
+    version = 1
+    requires = ('ohlcv',)
+    criteria = []
+
+    # Whether prior passes and near-misses of this strategy are screened first
+    # under a time budget; loose screens should leave this off
+    schedule_priority = False
+
+    # Output layout
+    output_file = None
+    passed_key = 'passed'
+    score_field = 'Score'
+
+    def __init__(self, analyzers):
+        """
+        Args:
+            analyzers: dict of shared analyzer instances keyed by
+                'earnings', 'newness', 'supply', 'leadership', 'turtle'
+        """
+        self.analyzers = analyzers
+
+    def get_criteria(self):
+        """Return the criteria a stock must pass."""
+        return list(self.criteria)
+
+    def get_config(self):
+        """Return the configuration that identifies this strategy's results."""
+        return {
+            'name': self.name,
+            'version': self.version,
+            'criteria': self.get_criteria()
+        }
+
+    def get_output_file(self):
+        """Return the results filename for this strategy."""
+        return self.output_file or f"{self.name}_results.json"
+
+    def check_criterion(self, criterion, ticker, data):
+        """
+        Evaluate a single criterion.
+
+        Returns: (pass: bool, details: dict)
+        """
+        raise NotImplementedError
+
+    def evaluate(self, ticker, data):
+        """
+        Evaluate all criteria and Turtle signals for one stock.
+
+        Args:
+            ticker: Stock ticker
+            data: dict with 'name', 'close_price', 'ohlcv' and, if required, 'financials'
+
+        Returns: dict with screening results
+        """
+        result = {
+            'ticker': ticker,
+            'company_name': data['name'],
+            'close_price': data['close_price'],
+            'score': 0,
+            'criteria': {}
+        }
+
+        criteria = self.get_criteria()
+        for criterion in criteria:
+            passes, details = self.check_criterion(criterion, ticker, data)
+            result['criteria'][criterion] = {'pass': passes, 'details': details}
+            if passes:
+                result['score'] += 1
+
+        result['passed'] = all(result['criteria'][c]['pass'] for c in criteria)
+
+        # Only stocks that pass the screen get Turtle signals
+        if result['passed']:
+            result['turtle_signals'] = self.analyzers['turtle'].generate_signals(ticker, data['ohlcv'])
+        else:
+            result['turtle_signals'] = []
+
+        return result
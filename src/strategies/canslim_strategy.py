@@ -0,0 +1,35 @@
+from .base import Strategy, register_strategy
+
+@register_strategy
+class CanslimStrategy(Strategy):
+    """CANSL(IM) screen with Turtle entry/exit signals."""
+
+    name = 'canslim'
+    version = 1
+    requires = ('ohlcv', 'financials')
+    criteria = ['C', 'A', 'N', 'S']
+    schedule_priority = True
+
+    output_file = 'screener_results.json'
+    passed_key = 'cansl_passed'
+    score_field = 'CANSLIM_Score'
+
+    def get_criteria(self):
+        """L is only required when sector data is available."""
+        criteria = list(self.criteria)
+        if self.analyzers['leadership'].is_available():
+            criteria.append('L')
+        return criteria
+
+    def check_criterion(self, criterion, ticker, data):
+        if criterion == 'C':
+            return self.analyzers['earnings'].check_c_criterion(ticker, data['financials'])
+        if criterion == 'A':
+            return self.analyzers['earnings'].check_a_criterion(ticker, data['financials'])
+        if criterion == 'N':
+            return self.analyzers['newness'].check_n_criterion(ticker, data['ohlcv'])
+        if criterion == 'S':
+            return self.analyzers['supply'].check_s_criterion(ticker, data['ohlcv'])
+        if criterion == 'L':
+            return self.analyzers['leadership'].check_l_criterion(ticker, data['ohlcv'], None)
+        raise ValueError(f"Unknown CANSLIM criterion: {criterion}")
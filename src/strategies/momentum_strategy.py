@@ -0,0 +1,39 @@
+from .base import Strategy, register_strategy
+
+@register_strategy
+class MomentumStrategy(Strategy):
+    """Price-only momentum screen: near 52-week high with strong relative strength."""
+
+    name = 'momentum'
+    version = 1
+    requires = ('ohlcv',)
+    criteria = ['N', 'RS']
+
+    score_field = 'Momentum_Score'
+
+    # Minimum 12-month weighted RS rating (weighted quarterly return, %)
+    min_rs_rating = 20
+
+    def get_config(self):
+        config = super().get_config()
+        config['min_rs_rating'] = self.min_rs_rating
+        return config
+
+    def check_criterion(self, criterion, ticker, data):
+        if criterion == 'N':
+            return self.analyzers['newness'].check_n_criterion(ticker, data['ohlcv'])
+        if criterion == 'RS':
+            return self.check_rs_criterion(ticker, data['ohlcv'])
+        raise ValueError(f"Unknown momentum criterion: {criterion}")
+
+    def check_rs_criterion(self, ticker, ohlcv):
+        """
+        RS - Relative Strength: 12-month weighted RS rating ≥ min_rs_rating.
+
+        Returns: (pass: bool, details: dict)
+        """
+        rs_rating = self.analyzers['leadership'].calculate_rs_rating(ticker, ohlcv)
+        if rs_rating is None:
+            return False, {'reason': 'Insufficient price history'}
+
+        return rs_rating >= self.min_rs_rating, {'rs_rating': round(rs_rating, 2)}
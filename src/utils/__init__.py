@@ -1,4 +1,12 @@
 from .logger import setup_logger
 from .api_limiter import APILimiter, rate_limited
+from .sharding import select_shard, merge_results
+from .result_store import ResultStore, compute_fingerprint
+from .result_writer import ResultWriter
+from .pipeline import run_pipeline
+from .scheduler import prioritize, Deadline
+from .store_stats import StoreStats
 
-__all__ = ['setup_logger', 'APILimiter', 'rate_limited']
\ No newline at end of file
+__all__ = ['setup_logger', 'APILimiter', 'rate_limited', 'select_shard', 'merge_results',
+           'ResultStore', 'compute_fingerprint', 'ResultWriter', 'run_pipeline',
+           'prioritize', 'Deadline', 'StoreStats']
\ No newline at end of file
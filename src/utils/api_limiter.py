@@ -1,3 +1,4 @@
+import threading
 import time
 from functools import wraps
 
@@ -7,13 +8,16 @@ class APILimiter:
     def __init__(self, calls_per_second=2):
         self.min_interval = 1.0 / calls_per_second
         self.last_call = 0
+        # Shared by concurrent fetch workers; serializes the wait so the rate holds overall
+        self.lock = threading.Lock()
     
     def wait(self):
         """Wait if necessary to respect rate limit."""
-        elapsed = time.time() - self.last_call
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
-        self.last_call = time.time()
+        with self.lock:
+            elapsed = time.time() - self.last_call
+            if elapsed < self.min_interval:
+                time.sleep(self.min_interval - elapsed)
+            self.last_call = time.time()
 
 def rate_limited(calls_per_second=2):
     """Decorator to rate limit function calls."""
@@ -0,0 +1,115 @@
+import queue
+import threading
+import time
+from .logger import setup_logger
+
+logger = setup_logger('pipeline')
+
+# Marks the end of a stage's input
+_DONE = object()
+
+def run_pipeline(items, fetch, analyze, emit, fetch_workers=2, queue_size=8, should_stop=None):
+    """
+    Run items through fetch -> analyze -> emit stages concurrently.
+
+    Stages are connected by bounded queues, so a slow stage applies backpressure
+    to the ones before it and at most a few items are held in memory at once.
+    Network-bound fetching overlaps with CPU-bound analysis, so total time
+    approaches the slower of the two instead of their sum. Results are emitted
+    in completion order, not input order.
+
+    Args:
+        items: iterable of work items (e.g. tickers)
+        fetch: fetch(item) -> data, run by `fetch_workers` threads
+        analyze: analyze(item, data) -> result, run by a single thread
+        emit: emit(item, result), run in the calling thread
+        fetch_workers: number of concurrent fetch threads
+        queue_size: capacity of each inter-stage queue
+        should_stop: optional callable; once it returns True no new items are
+            started, items already being fetched or analyzed still finish
+
+    Returns: dict with item count and busy time per stage
+    """
+    item_q = queue.Queue(maxsize=queue_size)
+    data_q = queue.Queue(maxsize=queue_size)
+    result_q = queue.Queue(maxsize=queue_size)
+    busy = {'fetch': 0.0, 'analyze': 0.0, 'emit': 0.0}
+    busy_lock = threading.Lock()
+
+    def record(stage, started):
+        with busy_lock:
+            busy[stage] += time.time() - started
+
+    def stopping():
+        return should_stop is not None and should_stop()
+
+    def feeder():
+        for item in items:
+            if stopping():
+                break
+            item_q.put(item)
+        for _ in range(fetch_workers):
+            item_q.put(_DONE)
+
+    def fetcher():
+        while True:
+            item = item_q.get()
+            if item is _DONE:
+                data_q.put(_DONE)
+                return
+            if stopping():
+                continue
+            started = time.time()
+            try:
+                data = fetch(item)
+            except Exception as e:
+                logger.error(f"Fetch failed for {item}: {e}")
+                data = None
+            record('fetch', started)
+            data_q.put((item, data))
+
+    def analyzer():
+        finished_fetchers = 0
+        while finished_fetchers < fetch_workers:
+            entry = data_q.get()
+            if entry is _DONE:
+                finished_fetchers += 1
+                continue
+            item, data = entry
+            started = time.time()
+            try:
+                result = analyze(item, data)
+            except Exception as e:
+                logger.error(f"Analysis failed for {item}: {e}")
+                result = None
+            record('analyze', started)
+            result_q.put((item, result))
+        result_q.put(_DONE)
+
+    threads = [threading.Thread(target=feeder, name='pipeline-feeder', daemon=True)]
+    threads += [
+        threading.Thread(target=fetcher, name=f'pipeline-fetch-{i}', daemon=True)
+        for i in range(fetch_workers)
+    ]
+    threads.append(threading.Thread(target=analyzer, name='pipeline-analyze', daemon=True))
+    for thread in threads:
+        thread.start()
+
+    count = 0
+    while True:
+        entry = result_q.get()
+        if entry is _DONE:
+            break
+        item, result = entry
+        started = time.time()
+        try:
+            emit(item, result)
+        except Exception as e:
+            logger.error(f"Emit failed for {item}: {e}")
+        record('emit', started)
+        count += 1
+
+    for thread in threads:
+        thread.join()
+
+    return {'items': count, **{f'{stage}_time': round(t, 1) for stage, t in busy.items()}}
@@ -0,0 +1,180 @@
+import hashlib
+import json
+from pathlib import Path
+from .logger import setup_logger
+
+logger = setup_logger('result_store')
+
+# Analyzers read at most the last 252 bars (52-week high, RS rating), so only
+# that tail is hashed; older bars falling out of get_ohlcv's calendar window
+# must not change the fingerprint
+FINGERPRINT_BARS = 252
+
+def _json_default(obj):
+    """Convert numpy scalars and other non-JSON types for storage."""
+    if hasattr(obj, 'item'):
+        return obj.item()
+    return str(obj)
+
+def compute_fingerprint(ohlcv, financial_data, config):
+    """
+    Fingerprint the inputs of a single screen.
+
+    Args:
+        ohlcv: DataFrame with OHLCV data; only the last FINGERPRINT_BARS bars count
+        financial_data: DART financial statements (DataFrame or None)
+        config: dict describing the analyzer configuration
+
+    Returns: hex digest that changes whenever any input changes
+    """
+    hasher = hashlib.sha256()
+
+    bars = ohlcv.tail(FINGERPRINT_BARS)
+    hasher.update(bars.index[-1].strftime('%Y%m%d').encode())
+    hasher.update(bars.index.values.tobytes())
+    hasher.update(bars.to_numpy(dtype='float64').tobytes())
+
+    latest_rcept_no = None
+    if financial_data is not None and hasattr(financial_data, 'columns') and 'rcept_no' in financial_data.columns:
+        latest_rcept_no = str(financial_data['rcept_no'].max())
+    hasher.update(f"rcept_no={latest_rcept_no}".encode())
+
+    hasher.update(json.dumps(config, sort_keys=True, default=_json_default).encode())
+    return hasher.hexdigest()
+
+def screen_status(result):
+    """Reduce a screen result to the fields downstream alerts care about."""
+    return {
+        'passed': bool(result.get('passed')),
+        'turtle_signals': sorted(result.get('turtle_signals', []))
+    }
+
+def _entries_checksum(entries):
+    return hashlib.sha256(
+        json.dumps(entries, ensure_ascii=False, sort_keys=True, default=_json_default).encode()
+    ).hexdigest()
+
+class ResultStore:
+    """Persists the latest screen result per ticker, keyed by input fingerprint."""
+
+    # Bump when the stored entry layout changes
+    SCHEMA_VERSION = 1
+
+    def __init__(self, store_file='data/results/default.json'):
+        self.store_file = Path(store_file)
+        self.entries = self._load()
+
+    def _read(self):
+        with open(self.store_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _load(self):
+        if not self.store_file.exists():
+            return {}
+        try:
+            data = self._read()
+        except Exception as e:
+            logger.warning(f"Result store unreadable, starting fresh: {e}")
+            return {}
+
+        if data.get('schema_version') != self.SCHEMA_VERSION:
+            logger.warning(f"Result store {self.store_file} schema {data.get('schema_version')} "
+                           f"is not {self.SCHEMA_VERSION}; starting fresh")
+            return {}
+        return data['entries']
+
+    def verify(self):
+        """
+        Check the stored file's schema version and checksum.
+
+        Returns: list of problem descriptions, empty if the store is intact
+        """
+        if not self.store_file.exists():
+            return []
+        try:
+            data = self._read()
+        except Exception as e:
+            return [f"unreadable: {e}"]
+
+        problems = []
+        if data.get('schema_version') != self.SCHEMA_VERSION:
+            problems.append(f"schema {data.get('schema_version')} is not {self.SCHEMA_VERSION}")
+        elif _entries_checksum(data.get('entries', {})) != data.get('sha256'):
+            problems.append('checksum mismatch')
+        return problems
+
+    def remove(self, tickers):
+        """Drop entries for the given tickers; returns the number removed."""
+        removed = [t for t in tickers if self.entries.pop(t, None) is not None]
+        return len(removed)
+
+    def lookup(self, ticker, fingerprint):
+        """Return the stored result if the fingerprint matches, otherwise None."""
+        entry = self.entries.get(ticker)
+        if entry and entry.get('fingerprint') == fingerprint:
+            return entry['result']
+        return None
+
+    def previous_status(self, ticker):
+        """Return the ticker's status from the previous run, or None if unseen."""
+        entry = self.entries.get(ticker)
+        return entry.get('status') if entry else None
+
+    def previous_result(self, ticker):
+        """Return the ticker's full result from the previous run, or None if unseen."""
+        entry = self.entries.get(ticker)
+        return entry.get('result') if entry else None
+
+    def has_open_position(self, ticker):
+        """Check if the ticker has had a Turtle buy signal without a later exit."""
+        entry = self.entries.get(ticker)
+        return bool(entry and entry.get('open_position'))
+
+    def update(self, ticker, fingerprint, result, position_signals=None):
+        """
+        Record a ticker's latest result.
+
+        Args:
+            position_signals: Turtle signals used to track an open position, for
+                stocks that no longer pass and so carry no turtle_signals
+                (defaults to the result's own signals)
+
+        Returns: change dict if the status differs from the previous run, otherwise None
+        """
+        previous = self.previous_status(ticker)
+        current = screen_status(result)
+
+        # A Turtle position stays open from a buy signal until an exit signal
+        open_position = self.has_open_position(ticker)
+        signals = current['turtle_signals'] if position_signals is None else position_signals
+        if any(s.endswith('_Exit') for s in signals):
+            open_position = False
+        elif any(s.endswith('_Buy') for s in signals):
+            open_position = True
+
+        # Round-trip through JSON so stored results match what lookup() returns
+        stored_result = json.loads(json.dumps(result, ensure_ascii=False, default=_json_default))
+        self.entries[ticker] = {
+            'fingerprint': fingerprint,
+            'result': stored_result,
+            'status': current,
+            'open_position': open_position
+        }
+
+        # A ticker seen for the first time is only a change if it is passing
+        if previous == current or (previous is None and not current['passed']):
+            return None
+        return {'previous': previous, 'current': current}
+
+    def save(self):
+        """Write the store atomically."""
+        self.store_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.store_file.with_suffix('.tmp')
+        data = {
+            'schema_version': self.SCHEMA_VERSION,
+            'sha256': _entries_checksum(self.entries),
+            'entries': self.entries
+        }
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, default=_json_default)
+        tmp_file.replace(self.store_file)
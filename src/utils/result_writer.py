@@ -0,0 +1,31 @@
+import json
+from pathlib import Path
+from .logger import setup_logger
+
+logger = setup_logger('result_writer')
+
+class ResultWriter:
+    """
+    Streams result records to a JSON Lines file as they are produced.
+
+    Each record is flushed immediately, so a run that is interrupted still
+    leaves every result emitted so far on disk.
+    """
+
+    def __init__(self, output_file):
+        self.output_file = Path(output_file)
+        self.output_file.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.output_file, 'w', encoding='utf-8')
+        self.count = 0
+
+    def write(self, record):
+        """Append one record."""
+        self.file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.file.flush()
+        self.count += 1
+
+    def close(self):
+        """Close the stream."""
+        if not self.file.closed:
+            self.file.close()
+            logger.info(f"Streamed {self.count} records to {self.output_file}")
@@ -0,0 +1,86 @@
+import threading
+import time
+from .logger import setup_logger
+
+logger = setup_logger('scheduler')
+
+# Priority tiers, most valuable first
+TIER_PASSED = 0
+TIER_NEAR_MISS = 1
+TIER_OPEN_POSITION = 2
+TIER_OTHER = 3
+
+def priority_tier(ticker, pass_stores, position_stores):
+    """
+    Rank a ticker by its status in the previous run.
+
+    Prior passes come first, then near-misses (exactly one criterion failed),
+    then tickers with an open Turtle position, then everything else. Only the
+    strategies in `pass_stores` decide the pass and near-miss tiers, so a
+    loose screen with few criteria cannot crowd out open positions.
+
+    Args:
+        ticker: Stock ticker
+        pass_stores: ResultStore instances whose passes and near-misses rank first
+        position_stores: ResultStore instances whose open positions rank next
+
+    Returns: int tier, lower is screened earlier
+    """
+    tier = TIER_OTHER
+    for store in pass_stores:
+        result = store.previous_result(ticker)
+        if result:
+            if result.get('passed'):
+                return TIER_PASSED
+            failed = [c for c, check in result.get('criteria', {}).items() if not check.get('pass')]
+            if len(failed) == 1:
+                tier = TIER_NEAR_MISS
+    if tier == TIER_OTHER and any(store.has_open_position(ticker) for store in position_stores):
+        tier = TIER_OPEN_POSITION
+    return tier
+
+def prioritize(tickers, pass_stores, position_stores):
+    """
+    Order tickers so the most valuable ones are screened first.
+
+    Ties keep ticker order, so the schedule is deterministic.
+
+    Returns: list of tickers sorted by priority tier
+    """
+    pass_stores = list(pass_stores)
+    position_stores = list(position_stores)
+    tiers = {ticker: priority_tier(ticker, pass_stores, position_stores) for ticker in tickers}
+    ordered = sorted(tickers, key=lambda t: (tiers[t], t))
+
+    counts = [sum(1 for t in tiers.values() if t == tier) for tier in range(TIER_OTHER + 1)]
+    logger.info(f"Schedule: {counts[TIER_PASSED]} prior passes, {counts[TIER_NEAR_MISS]} near-misses, "
+                f"{counts[TIER_OPEN_POSITION]} open positions, {counts[TIER_OTHER]} others")
+    return ordered
+
+class Deadline:
+    """Wall-clock budget for a run."""
+
+    def __init__(self, budget_seconds=None):
+        self.budget_seconds = budget_seconds
+        self.started = time.time()
+        self.announced = False
+        # expired() is polled by several pipeline threads
+        self.lock = threading.Lock()
+
+    def remaining(self):
+        """Return seconds left, or None if there is no budget."""
+        if self.budget_seconds is None:
+            return None
+        return self.budget_seconds - (time.time() - self.started)
+
+    def expired(self):
+        """Check if the budget is used up."""
+        remaining = self.remaining()
+        if remaining is None or remaining > 0:
+            return False
+        with self.lock:
+            if not self.announced:
+                logger.warning(f"Time budget of {self.budget_seconds:.0f}s exhausted; "
+                               f"stopping after in-flight stocks")
+                self.announced = True
+        return True
@@ -0,0 +1,86 @@
+import zlib
+from .logger import setup_logger
+
+logger = setup_logger('sharding')
+
+def select_shard(tickers, shard_index, shard_count):
+    """
+    Select a deterministic, load-balanced slice of the universe.
+
+    Each ticker is assigned by a stable hash of its code, so a ticker stays on
+    the same shard (and in that shard's local caches) when index rebalances add
+    or remove other tickers. Hashing spreads tickers roughly evenly across
+    shards, and the result does not depend on the order returned by the data
+    provider.
+
+    Args:
+        tickers: Full list of tickers
+        shard_index: Zero-based index of this shard
+        shard_count: Total number of shards
+
+    Returns: list of tickers assigned to this shard
+    """
+    if shard_count < 1:
+        raise ValueError(f"shard_count must be at least 1, got {shard_count}")
+    if not 0 <= shard_index < shard_count:
+        raise ValueError(f"shard_index must be in [0, {shard_count}), got {shard_index}")
+
+    return sorted(t for t in tickers if zlib.crc32(t.encode()) % shard_count == shard_index)
+
+def merge_results(partials):
+    """
+    Merge per-shard outputs of one strategy into a single result set.
+
+    Every list in the shard outputs (passed stocks, Turtle signals, status
+    changes) is concatenated and sorted by ticker, and per-shard coverage is
+    combined. Each shard records the full universe, so the tickers assigned to
+    a shard that produced no output are recomputed and counted as unscreened.
+
+    Args:
+        partials: list of output dicts written by individual shards
+
+    Returns: merged output dict in the strategy's standard results format
+    """
+    if not partials:
+        raise ValueError("No shard results to merge")
+
+    shard_count = partials[0].get('shard', {}).get('count', len(partials))
+    seen = sorted(p.get('shard', {}).get('index', -1) for p in partials)
+    missing = sorted(set(range(shard_count)) - set(seen))
+    if missing:
+        logger.warning(f"Missing results for shards {missing} of {shard_count}")
+
+    merged = {'last_updated': max(p['last_updated'] for p in partials)}
+    if 'strategy' in partials[0]:
+        merged['strategy'] = partials[0]['strategy']
+
+    for partial in partials:
+        for key, value in partial.items():
+            if isinstance(value, list):
+                merged.setdefault(key, []).extend(value)
+
+    for key, value in merged.items():
+        if isinstance(value, list):
+            value.sort(key=lambda s: (s['Ticker'], s.get('Turtle_Signal', '')))
+
+    # Missing shards count as unscreened, so the merged result is labeled partial
+    coverages = [p['coverage'] for p in partials if 'coverage' in p]
+    if coverages:
+        universe = set()
+        for partial in partials:
+            universe.update(partial.get('shard', {}).get('universe', []))
+        if missing and not universe:
+            logger.warning("Shard outputs do not list the universe; "
+                           "missing shards' tickers are not counted in coverage")
+        missing_tickers = [t for i in missing for t in select_shard(universe, i, shard_count)]
+
+        unscreened = sorted([t for c in coverages for t in c['unscreened']] + missing_tickers)
+        merged['coverage'] = {
+            'complete': not missing and all(c['complete'] for c in coverages),
+            'screened': sum(c['screened'] for c in coverages),
+            'total': sum(c['total'] for c in coverages) + len(missing_tickers),
+            'unscreened': unscreened,
+            'missing_shards': missing
+        }
+
+    return merged
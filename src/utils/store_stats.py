@@ -0,0 +1,54 @@
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from .logger import setup_logger
+
+logger = setup_logger('store_stats')
+
+class StoreStats:
+    """
+    Counts cache hits and misses per local data store.
+
+    Counts are accumulated in memory during a run and merged into a JSON file
+    holding both the last run's counts and running totals.
+    """
+
+    def __init__(self, stats_file='data/store_stats.json'):
+        self.stats_file = Path(stats_file)
+        self.counts = {}
+        self.lock = threading.Lock()
+
+    def record(self, store, event):
+        """Count one event (e.g. 'hit', 'miss', 'rebuild') for a store."""
+        with self.lock:
+            store_counts = self.counts.setdefault(store, {})
+            store_counts[event] = store_counts.get(event, 0) + 1
+
+    def load(self):
+        """Return the persisted stats, or an empty layout."""
+        if not self.stats_file.exists():
+            return {'last_run': None, 'stores': {}}
+        try:
+            with open(self.stats_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Store stats unreadable, starting fresh: {e}")
+            return {'last_run': None, 'stores': {}}
+
+    def save(self):
+        """Merge this run's counts into the stats file."""
+        stats = self.load()
+        with self.lock:
+            for store, counts in self.counts.items():
+                entry = stats['stores'].setdefault(store, {'last_run': {}, 'total': {}})
+                entry['last_run'] = dict(counts)
+                for event, count in counts.items():
+                    entry['total'][event] = entry['total'].get(event, 0) + count
+        stats['last_run'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        self.stats_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.stats_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(stats, f, ensure_ascii=False, indent=2)
+        tmp_file.replace(self.stats_file)